@@ -11,19 +11,102 @@ from matplotlib.animation import FuncAnimation
 from numpy.random import Generator
 
 
-def pbc(shape: int, index: int) -> int:
-    """Periodic boundary conditions of a lattice.
+try:
+    from numba import njit
+    from numba import prange
+
+    _HAVE_NUMBA = True
+except ImportError:  # pragma: no cover
+    prange = range
+    _HAVE_NUMBA = False
+
+try:
+    import cupy
+
+    _HAVE_CUPY = True
+except ImportError:
+    cupy = None
+    _HAVE_CUPY = False
+
+
+def _glauber_sweep(lattice, energy_j, exp_table, n_steps):
+    """Perform a compiled Metropolis sweep of Glauber updates.
+
+    Args:
+        lattice: MxN spin lattice, updated in place.
+        energy_j: Interaction energy of an aligned pair.
+        exp_table: Boltzmann factors indexed by the (integer) energy change.
+        n_steps: Number of single-site update attempts.
+
+    Returns:
+        Number of accepted flips.
+    """
+    m, n = lattice.shape
+    flips = 0
+    for _ in range(n_steps):
+        i = np.random.randint(0, m)
+        j = np.random.randint(0, n)
+        neighbour_sum = (
+            lattice[(i - 1) % m, j]
+            + lattice[(i + 1) % m, j]
+            + lattice[i, (j - 1) % n]
+            + lattice[i, (j + 1) % n]
+        )
+        delta_energy = 2.0 * energy_j * lattice[i, j] * neighbour_sum
+        if delta_energy <= 0.0 or np.random.random() <= exp_table[int(delta_energy)]:
+            lattice[i, j] = -lattice[i, j]
+            flips += 1
+    return flips
+
+
+def _site_energy(lattice, i, j, energy_j):
+    """Compute the energy at one site without interpreter overhead.
+
+    Args:
+        lattice: MxN spin lattice.
+        i: Position along first axis.
+        j: Position along second axis.
+        energy_j: Interaction energy of an aligned pair.
+
+    Returns:
+        Total energy at the site.
+    """
+    m, n = lattice.shape
+    neighbour_sum = (
+        lattice[(i - 1) % m, j]
+        + lattice[(i + 1) % m, j]
+        + lattice[i, (j - 1) % n]
+        + lattice[i, (j + 1) % n]
+    )
+    return energy_j * neighbour_sum * lattice[i, j]
+
+
+def _total_energy(lattice, energy_j):
+    """Accumulate the total lattice energy in a single streaming pass.
 
     Args:
-        shape (int): Size of axis.
-        index (int): Index on axis.
+        lattice: MxN spin lattice.
+        energy_j: Interaction energy of an aligned pair.
 
     Returns:
-        int: Index with pbc applied.
+        Total energy of the lattice.
     """
-    if (index > shape - 1) or (index < 0):
-        index = index % shape
-    return index
+    m, n = lattice.shape
+    total = 0.0
+    for i in prange(m):
+        ip = (i + 1) % m
+        row_total = 0.0
+        for j in range(n):
+            jp = (j + 1) % n
+            row_total += lattice[i, j] * (lattice[ip, j] + lattice[i, jp])
+        total += row_total
+    return -energy_j * total
+
+
+if _HAVE_NUMBA:
+    _glauber_sweep = njit(cache=True)(_glauber_sweep)
+    _site_energy = njit(cache=True)(_site_energy)
+    _total_energy = njit(cache=True, parallel=True)(_total_energy)
 
 
 class Model:
@@ -37,6 +120,7 @@ class Model:
         energy_j: Optional[int] = 1,
         k_b: Optional[float] = 1.0,
         rng: Optional[Generator] = None,
+        use_gpu: Optional[bool] = False,
     ):
         """Initialise a lattice.
 
@@ -49,22 +133,56 @@ class Model:
             k_b (float, optional): Boltzmann constant. Defaults to 1.0.
             rng (Generator, optional.): Numpy random number Generator.
                 Defaults to np.random.default_rng().
+            use_gpu (bool, optional): Run Glauber sweeps on the GPU with cupy.
+                Ignored when cupy is not installed. Defaults to False.
         """
         self.rng = rng or np.random.default_rng()
 
         self.shape = shape
 
-        self.lattice = self.rng.random(self.shape)
-        self.lattice[self.lattice >= 0.5] = 1.0
-        self.lattice[self.lattice != 1.0] = -1.0
+        self.lattice = self.rng.integers(0, 2, size=self.shape, dtype=np.int8) * 2 - 1
+
+        self._parity = (
+            np.add.outer(np.arange(self.shape[0]), np.arange(self.shape[1])) % 2
+        )
+
+        self.im1 = (np.arange(self.shape[0]) - 1) % self.shape[0]
+        self.ip1 = (np.arange(self.shape[0]) + 1) % self.shape[0]
+        self.jm1 = (np.arange(self.shape[1]) - 1) % self.shape[1]
+        self.jp1 = (np.arange(self.shape[1]) + 1) % self.shape[1]
 
         self.dynamics = dynamics
-        self.temperature = temperature
         self.k_b = k_b
+        self.energy_j = energy_j
 
-        self.base_exponential = math.exp(-1.0 / (self.k_b * self.temperature))
+        self.temperature = temperature
 
-        self.energy_j = energy_j
+        self.use_gpu = bool(use_gpu) and _HAVE_CUPY
+        if self.use_gpu:  # pragma: no cover
+            self._gpu_parity = cupy.asarray(self._parity)
+            self._gpu_exp_table = cupy.asarray(self._exp_table)
+
+    @property
+    def temperature(self) -> float:
+        """Temperature of the system."""
+        return self._temperature
+
+    @temperature.setter
+    def temperature(self, value: float) -> None:
+        self._temperature = value
+        self._rebuild_accept_table()
+
+    def _rebuild_accept_table(self) -> None:
+        """Recompute the cached Boltzmann factors for the current temperature."""
+        beta = 1.0 / (self.k_b * self._temperature)
+        self.base_exponential = math.exp(-beta)
+        self._exp_table = np.exp(-np.arange(8 * self.energy_j + 1) * beta)
+        self.accept_table = np.exp(-2 * self.energy_j * np.arange(9) * beta)
+        # Above this energy change exp(-dE*beta) underflows below 2**-53,
+        # so no uniform draw can ever accept the flip.
+        self._reject_cutoff = 53 * math.log(2) / beta
+        if getattr(self, "use_gpu", False):  # pragma: no cover
+            self._gpu_exp_table = cupy.asarray(self._exp_table)
 
     @property
     def magnetism(self):
@@ -74,11 +192,14 @@ class Model:
     @property
     def energy(self):
         """Calculate total energy in the lattice."""
-        total_energy_lattice = self.lattice * (
-            np.roll(self.lattice, 1, 0) + np.roll(self.lattice, 1, 1)
-        )
+        if _HAVE_NUMBA:
+            return _total_energy(self.lattice, self.energy_j)
 
-        return -self.energy_j * total_energy_lattice.sum()
+        up = np.concatenate([self.lattice[-1:], self.lattice[:-1]], axis=0)
+        left = np.concatenate([self.lattice[:, -1:], self.lattice[:, :-1]], axis=1)
+        total_energy_lattice = self.lattice * (up + left)
+
+        return -self.energy_j * int(total_energy_lattice.sum())
 
     def energy_at_site(self, i_index: int, j_index: int) -> float:
         """Energy at a given site.
@@ -90,25 +211,47 @@ class Model:
         Returns:
             float: Total energy at site.
         """
-        site_energy = 0.0
-        site_energy += self.lattice[pbc(self.shape[0], i_index - 1)][j_index]
-        site_energy += self.lattice[pbc(self.shape[0], i_index + 1)][j_index]
-        site_energy += self.lattice[i_index][pbc(self.shape[1], j_index + 1)]
-        site_energy += self.lattice[i_index][pbc(self.shape[1], j_index - 1)]
+        if _HAVE_NUMBA:
+            return _site_energy(self.lattice, i_index, j_index, self.energy_j)
+
+        lattice = self.lattice
+        site_energy = (
+            lattice[self.im1[i_index], j_index]
+            + lattice[self.ip1[i_index], j_index]
+            + lattice[i_index, self.jm1[j_index]]
+            + lattice[i_index, self.jp1[j_index]]
+        )
 
-        return self.energy_j * site_energy * self.lattice[i_index, j_index]
+        return self.energy_j * site_energy * lattice[i_index, j_index]
 
-    def glauber_update(self) -> None:
-        """Use Glauber dynamics to update the lattice."""
-        i_index = self.rng.integers(0, self.shape[0])
-        j_index = self.rng.integers(0, self.shape[1])
+    def glauber_update(
+        self,
+        i_index: Optional[int] = None,
+        j_index: Optional[int] = None,
+        random_number: Optional[float] = None,
+    ) -> None:
+        """Use Glauber dynamics to update the lattice.
+
+        Args:
+            i_index (int, optional): Pre-drawn position along first axis.
+                Drawn from the generator if omitted.
+            j_index (int, optional): Pre-drawn position along second axis.
+                Drawn from the generator if omitted.
+            random_number (float, optional): Pre-drawn uniform for the
+                metropolis test. Drawn from the generator if omitted.
+        """
+        m, n = self.shape
+        if i_index is None:
+            i_index = self.rng.integers(0, m)
+        if j_index is None:
+            j_index = self.rng.integers(0, n)
 
         delta_energy = self.glauber_energy(i_index, j_index)
 
-        swap = self.metropolis_test(delta_energy)
+        swap = self.metropolis_test(delta_energy, random_number)
 
         if swap:
-            self.lattice[i_index][j_index] *= -1.0
+            self.lattice[i_index, j_index] = -self.lattice[i_index, j_index]
 
     def glauber_energy(self, i_index: int, j_index: int) -> float:
         """Calculate the energy change by swapping the flip at given site.
@@ -122,25 +265,101 @@ class Model:
         """
         return 2 * self.energy_at_site(i_index, j_index)
 
-    def kawasaki_update(self):
-        """Use Kawasaki Dynamics to update the model."""
-        i1 = 0
-        i2 = 0
-        j1 = 0
-        j2 = 0
+    def checkerboard_update(self) -> int:
+        """Use vectorized checkerboard Glauber dynamics to update the lattice.
+
+        Sites of one checkerboard colour are conditionally independent
+        given the other sublattice, so each colour is updated in a single
+        whole-array Metropolis pass instead of one Python call per site.
+        The passes run on the GPU when the model was built with use_gpu
+        and cupy is installed.
+
+        Returns:
+            int: Number of accepted flips.
+        """
+        if self.use_gpu:  # pragma: no cover
+            xp = cupy
+            lattice = cupy.asarray(self.lattice)
+            parity = self._gpu_parity
+            exp_table = self._gpu_exp_table
+        else:
+            xp = np
+            lattice = self.lattice
+            parity = self._parity
+            exp_table = self._exp_table
+
+        flips = 0
+        for colour in (0, 1):
+            neighbour_sum = (
+                xp.roll(lattice, 1, 0)
+                + xp.roll(lattice, -1, 0)
+                + xp.roll(lattice, 1, 1)
+                + xp.roll(lattice, -1, 1)
+            )
+            delta_energy = 2.0 * self.energy_j * lattice * neighbour_sum
+            if self.use_gpu:  # pragma: no cover
+                uniform = cupy.random.random(self.shape)
+            else:
+                uniform = self.rng.random(self.shape)
+            accept = (delta_energy <= 0.0) | (
+                uniform <= exp_table[xp.clip(delta_energy, 0, None).astype(xp.int64)]
+            )
+            flip = accept & (parity == colour)
+            lattice[flip] = -lattice[flip]
+            flips += int(flip.sum())
+
+        if self.use_gpu:  # pragma: no cover
+            self.lattice = cupy.asnumpy(lattice)
+
+        return flips
+
+    def kawasaki_update(
+        self,
+        i1: Optional[int] = None,
+        j1: Optional[int] = None,
+        i2: Optional[int] = None,
+        j2: Optional[int] = None,
+        random_number: Optional[float] = None,
+    ) -> int:
+        """Use Kawasaki Dynamics to update the model.
+
+        Args:
+            i1 (int, optional): Pre-drawn position along first axis of site 1.
+                Drawn from the generator if omitted.
+            j1 (int, optional): Pre-drawn position along second axis of site 1.
+                Drawn from the generator if omitted.
+            i2 (int, optional): Pre-drawn position along first axis of site 2.
+                Drawn from the generator if omitted.
+            j2 (int, optional): Pre-drawn position along second axis of site 2.
+                Drawn from the generator if omitted.
+            random_number (float, optional): Pre-drawn uniform for the
+                metropolis test. Drawn from the generator if omitted.
+
+        Returns:
+            int: Number of spins flipped (0 or 2).
+        """
+        m, n = self.shape
+        if i1 is None or j1 is None:
+            i1 = self.rng.integers(0, m)
+            j1 = self.rng.integers(0, n)
+        if i2 is None or j2 is None:
+            i2 = i1
+            j2 = j1
 
         while (i1 == i2) and (j1 == j2):
-            i1 = self.rng.integers(0, self.shape[0])
-            i2 = self.rng.integers(0, self.shape[0])
-            j1 = self.rng.integers(0, self.shape[1])
-            j2 = self.rng.integers(0, self.shape[1])
+            i2 = self.rng.integers(0, m)
+            j2 = self.rng.integers(0, n)
 
-        if self.lattice[i1][j1] != self.lattice[i2][j2]:
+        lattice = self.lattice
+        if lattice[i1, j1] != lattice[i2, j2]:
             delta_energy = self.kawasaki_energy(i1, i2, j1, j2)
-            swap = self.metropolis_test(delta_energy)
+            swap = self.metropolis_test(delta_energy, random_number)
             if swap:
-                self.lattice[i1][j1] *= -1
-                self.lattice[i2][j2] *= -1
+                lattice[i1, j1] = -lattice[i1, j1]
+                lattice[i2, j2] = -lattice[i2, j2]
+                return 2
+
+        return 0
 
     def kawasaki_energy(self, i1: int, i2: int, j1: int, j2: int) -> float:
         """Calculate the energy change by swapping the flip at two sites.
@@ -154,52 +373,72 @@ class Model:
         Returns:
             float: Energy change
         """
+        m, n = self.shape
         site_1_swap = 2.0 * self.energy_at_site(i1, j1)
         site_2_swap = 2.0 * self.energy_at_site(i2, j2)
         total_energy = site_1_swap + site_2_swap
-        if (i1 == i2) and (
-            j1 in [pbc(j2 + 1, self.shape[1]), pbc(j2 - 1, self.shape[1])]
-        ):
+        if (i1 == i2) and ((j1 - j2) % n in (1, n - 1)):
             total_energy -= 2.0 * self.energy_j
-        if (j1 == j2) and (
-            i1 in [pbc(i2 + 1, self.shape[0]), pbc(i2 - 1, self.shape[0])]
-        ):
+        if (j1 == j2) and ((i1 - i2) % m in (1, m - 1)):
             total_energy -= 2.0 * self.energy_j
 
-        return site_1_swap + site_2_swap
+        return total_energy
 
-    def metropolis_test(self, delta_energy: float) -> bool:
+    def metropolis_test(
+        self, delta_energy: float, random_number: Optional[float] = None
+    ) -> bool:
         """Determine if a flip should be completed.
 
         Args:
             delta_energy (float): Change in energy.
+            random_number (float, optional): Pre-drawn uniform.
+                Drawn from the generator if omitted.
 
         Returns:
             bool: True if keep change. False is not.
         """
         if delta_energy <= 0.0:
             return True
-
-        else:
+        if delta_energy > self._reject_cutoff:
+            return False
+        if random_number is None:
             random_number = self.rng.random()
-            probability = self.base_exponential**delta_energy
-            if random_number <= probability:
-                return True
+        return random_number <= self.accept_table[
+            int(delta_energy) // (2 * self.energy_j)
+        ]
 
-        return False
+    def update(self) -> int:
+        """Animation update.
 
-    def update(self):
-        """Animation update."""
-        for _ in range(self.shape[0] * self.shape[1]):
-            if self.dynamics == "glauber":
-                self.glauber_update()
-            elif self.dynamics == "kawasaki":
-                self.kawasaki_update()
+        Returns:
+            int: Number of spins flipped during the sweep.
+        """
+        n_steps = self.shape[0] * self.shape[1]
+        flips = 0
+        if self.dynamics == "glauber":
+            if _HAVE_NUMBA and not self.use_gpu:
+                flips = _glauber_sweep(
+                    self.lattice, self.energy_j, self._exp_table, n_steps
+                )
+            else:
+                flips = self.checkerboard_update()
+        elif self.dynamics == "kawasaki":
+            i1s = self.rng.integers(0, self.shape[0], size=n_steps)
+            j1s = self.rng.integers(0, self.shape[1], size=n_steps)
+            i2s = self.rng.integers(0, self.shape[0], size=n_steps)
+            j2s = self.rng.integers(0, self.shape[1], size=n_steps)
+            uniforms = self.rng.random(n_steps)
+            for step in range(n_steps):
+                flips += self.kawasaki_update(
+                    i1s[step], j1s[step], i2s[step], j2s[step], uniforms[step]
+                )
+        return flips
 
     def frame_update(self, i):
         """Animation frame update."""
-        self.update()
-        self.mat.set_data(self.lattice)
+        flips = self.update()
+        if flips:
+            self.mat.set_data(self.lattice)
         self.text.set_text(f"Sweep: {i+1}/{self.animation_frames}")
         return (self.mat,)
 
@@ -0,0 +1,102 @@
+"""Batched model running many replicas at per-replica temperatures."""
+
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+import numpy as np
+from numpy.random import Generator
+
+
+class ReplicaModel:
+    """Glauber dynamics on a batch of independent lattice replicas.
+
+    The lattice is stored structure-of-arrays style with shape
+    (replicas, M, N), so one vectorized checkerboard sweep advances every
+    replica at once and each replica's rows stay contiguous in memory.
+    Each replica has its own temperature, which makes the batch a natural
+    building block for parallel tempering.
+    """
+
+    def __init__(
+        self,
+        shape: Tuple[int, int],
+        temperatures: Sequence[float],
+        energy_j: Optional[int] = 1,
+        k_b: Optional[float] = 1.0,
+        rng: Optional[Generator] = None,
+    ):
+        """Initialise the batched lattice.
+
+        Args:
+            shape (Tuple[int,int]): MxN shape to make each lattice.
+            temperatures (Sequence[float]): Temperature of each replica;
+                the length sets the number of replicas.
+            energy_j (int, optional): Amout energy of system is lowered by aligned pair.
+                Defaults to 1.
+            k_b (float, optional): Boltzmann constant. Defaults to 1.0.
+            rng (Generator, optional.): Numpy random number Generator.
+                Defaults to np.random.default_rng().
+        """
+        self.rng = rng or np.random.default_rng()
+
+        self.shape = shape
+        self.temperatures = np.asarray(temperatures, dtype=np.float64)
+        self.replicas = self.temperatures.shape[0]
+
+        self.lattice = (
+            self.rng.integers(
+                0, 2, size=(self.replicas,) + tuple(shape), dtype=np.int8
+            )
+            * 2
+            - 1
+        )
+
+        self.k_b = k_b
+        self.energy_j = energy_j
+
+        self._parity = np.add.outer(np.arange(shape[0]), np.arange(shape[1])) % 2
+
+        self._exp_table = np.exp(
+            -np.arange(8 * self.energy_j + 1)
+            / (self.k_b * self.temperatures[:, np.newaxis])
+        )
+        self._replica_index = np.arange(self.replicas)[:, np.newaxis, np.newaxis]
+
+    @property
+    def magnetism(self) -> np.ndarray:
+        """Calculate total magnetism of each replica."""
+        return np.abs(self.lattice.sum(axis=(1, 2)))
+
+    @property
+    def energy(self) -> np.ndarray:
+        """Calculate total energy of each replica."""
+        total_energy_lattice = self.lattice * (
+            np.roll(self.lattice, 1, 1) + np.roll(self.lattice, 1, 2)
+        )
+
+        return -self.energy_j * total_energy_lattice.sum(axis=(1, 2))
+
+    def checkerboard_update(self) -> None:
+        """Use vectorized checkerboard Glauber dynamics on every replica."""
+        for colour in (0, 1):
+            neighbour_sum = (
+                np.roll(self.lattice, 1, 1)
+                + np.roll(self.lattice, -1, 1)
+                + np.roll(self.lattice, 1, 2)
+                + np.roll(self.lattice, -1, 2)
+            )
+            delta_energy = 2.0 * self.energy_j * self.lattice * neighbour_sum
+            boltzmann = self._exp_table[
+                self._replica_index,
+                np.clip(delta_energy, 0, None).astype(np.int64),
+            ]
+            accept = (delta_energy <= 0.0) | (
+                self.rng.random(self.lattice.shape) <= boltzmann
+            )
+            flip = accept & (self._parity == colour)
+            self.lattice[flip] = -self.lattice[flip]
+
+    def update(self) -> None:
+        """Perform one sweep of every replica."""
+        self.checkerboard_update()
@@ -8,10 +8,11 @@ def test_model():
     from IsingModel.ising import Model
 
     shape = (10, 5)
-    model = Model(shape=shape)
+    model = Model(shape=shape, dynamics="glauber", temperature=1.0)
 
     assert model.shape[0] == 10
     assert model.shape[1] == 5
+    assert model.lattice.dtype == np.int8
     assert not np.any((-1.0 < model.lattice) & (model.lattice < 1.0))
     assert not np.any(model.lattice > 1.0)
     assert not np.any(model.lattice < -1.0)
@@ -22,7 +23,7 @@ def test_total_magnetism():
     from IsingModel.ising import Model
 
     shape = (5, 5)
-    model = Model(shape=shape)
+    model = Model(shape=shape, dynamics="glauber", temperature=1.0)
 
     model.lattice = np.ones(model.shape)
     assert model.magnetism == 25
@@ -41,7 +42,9 @@ def test_total_energy():
     shape = (5, 5)
     energy_j = 2
 
-    model = Model(shape=shape, energy_J=energy_j)
+    model = Model(
+        shape=shape, dynamics="glauber", temperature=1.0, energy_j=energy_j
+    )
     model.lattice = np.array([[1.0, -1.0, 1.0], [-1.0, 1.0, -1.0], [1.0, -1.0, 1.0]])
     assert model.energy == 12
 
@@ -52,30 +55,115 @@ def test_total_energy():
     assert model.energy == -100
 
 
-def test_pbc():
-    """Test periodic boundary conditions."""
-    from IsingModel.ising import pbc
+def test_neighbour_indices():
+    """Test precomputed periodic neighbour index arrays."""
+    from IsingModel.ising import Model
+
+    model = Model(shape=(5, 3), dynamics="glauber", temperature=1.0)
 
-    assert pbc(5, 1) == 1
-    assert pbc(5, 6) == 1
-    assert pbc(5, -1) == 4
+    assert list(model.im1) == [4, 0, 1, 2, 3]
+    assert list(model.ip1) == [1, 2, 3, 4, 0]
+    assert list(model.jm1) == [2, 0, 1]
+    assert list(model.jp1) == [1, 2, 0]
 
 
 def test_metroplis_test():
     """Test the metroplis test."""
     from IsingModel.ising import Model
 
-    model = Model(shape=(5, 5), temperature=1.0)
+    model = Model(shape=(5, 5), dynamics="glauber", temperature=1.0)
 
     assert model.metropolis_test(0.0)
     assert model.metropolis_test(-1.0)
 
+    cold = Model(shape=(5, 5), dynamics="glauber", temperature=0.01)
+    state = cold.rng.bit_generator.state
+    assert not cold.metropolis_test(4.0)
+    assert not cold.metropolis_test(8.0)
+    assert cold.rng.bit_generator.state == state
+
+
+def test_checkerboard_update():
+    """Test the vectorized checkerboard sweep."""
+    from IsingModel.ising import Model
+
+    model = Model(shape=(4, 4), dynamics="glauber", temperature=2.0)
+    model.checkerboard_update()
+    assert np.all(np.abs(model.lattice) == 1)
+
+    cold = Model(shape=(4, 4), dynamics="glauber", temperature=0.01)
+    cold.lattice = np.ones(cold.shape)
+    assert cold.checkerboard_update() == 0
+    assert np.all(cold.lattice == 1)
+
+
+def test_use_gpu_fallback():
+    """Test use_gpu degrades to the CPU path when cupy is missing."""
+    from IsingModel import ising
+    from IsingModel.ising import Model
+
+    model = Model(shape=(4, 4), dynamics="glauber", temperature=2.0, use_gpu=True)
+    assert model.use_gpu == ising._HAVE_CUPY
+    model.update()
+    assert np.all(np.abs(model.lattice) == 1)
+
+
+def test_update():
+    """Test a full sweep keeps the lattice well formed."""
+    from IsingModel.ising import Model
+
+    for dynamics in ["glauber", "kawasaki"]:
+        model = Model(shape=(5, 5), dynamics=dynamics, temperature=2.0)
+        total = np.sum(model.lattice)
+        flips = model.update()
+        assert flips >= 0
+        assert np.all(np.abs(model.lattice) == 1)
+        if dynamics == "kawasaki":
+            assert np.sum(model.lattice) == total
+
+
+def test_temperature_setter():
+    """Test changing the temperature rebuilds the acceptance table."""
+    import math
+
+    from IsingModel.ising import Model
+
+    model = Model(shape=(4, 4), dynamics="glauber", temperature=1.0)
+    assert model.accept_table[1] == math.exp(-2.0)
+
+    model.temperature = 2.0
+    assert model.temperature == 2.0
+    assert model.accept_table[1] == math.exp(-1.0)
+    assert model.accept_table[0] == 1.0
+
+
+def test_kawasaki_update_distinct_sites():
+    """Test Kawasaki updates redraw coincident site pairs."""
+    from IsingModel.ising import Model
+
+    model = Model(shape=(4, 4), dynamics="kawasaki", temperature=1.0)
+    total = np.sum(model.lattice)
+    model.kawasaki_update(0, 0, 0, 0, 0.5)
+    assert np.sum(model.lattice) == total
+
+
+def test_kawasaki_energy():
+    """Test calculating delta E using kawasaki."""
+    from IsingModel.ising import Model
+
+    model = Model(shape=(3, 3), dynamics="kawasaki", temperature=1.0)
+
+    model.lattice = np.array([[1.0, -1.0, 1.0], [-1.0, 1.0, -1.0], [1.0, -1.0, 1.0]])
+
+    assert model.kawasaki_energy(0, 0, 0, 1) == -6
+    assert model.kawasaki_energy(0, 1, 0, 1) == -8
+
 
 def test_glauber_energy():
     """Test calculating delta E using glauber."""
     from IsingModel.ising import Model
 
-    model = Model(shape=(3, 3), temperature=1.0)
+    model = Model(shape=(3, 3), dynamics="glauber", temperature=1.0)
 
     model.lattice = np.array([[1.0, -1.0, 1.0], [-1.0, 1.0, -1.0], [1.0, -1.0, 1.0]])
 
@@ -0,0 +1,57 @@
+"""Test the multispin module."""
+
+import numpy as np
+
+
+def test_multispin_model():
+    """Test the MultispinModel class."""
+    from IsingModel.multispin import MultispinModel
+
+    shape = (10, 5)
+    model = MultispinModel(shape=shape, temperature=1.0)
+
+    assert model.bits.shape == shape
+    assert model.bits.dtype == np.uint64
+
+
+def test_multispin_magnetism():
+    """Test per-replica magnetism on saturated lattices."""
+    from IsingModel.multispin import MultispinModel
+    from IsingModel.multispin import REPLICAS
+
+    shape = (5, 5)
+    model = MultispinModel(shape=shape, temperature=1.0)
+
+    model.bits = np.full(shape, np.uint64(0xFFFFFFFFFFFFFFFF))
+    assert np.all(model.magnetism == 25)
+
+    model.bits = np.zeros(shape, dtype=np.uint64)
+    assert model.magnetism.shape == (REPLICAS,)
+    assert np.all(model.magnetism == 25)
+
+
+def test_multispin_energy():
+    """Test per-replica energy on saturated lattices."""
+    from IsingModel.multispin import MultispinModel
+
+    shape = (5, 5)
+    model = MultispinModel(shape=shape, temperature=1.0)
+
+    model.bits = np.full(shape, np.uint64(0xFFFFFFFFFFFFFFFF))
+    assert np.all(model.energy == -50)
+
+    model.bits = np.zeros(shape, dtype=np.uint64)
+    assert np.all(model.energy == -50)
+
+
+def test_multispin_update():
+    """Test a sweep keeps the packed lattice well formed."""
+    from IsingModel.multispin import MultispinModel
+
+    shape = (4, 4)
+    model = MultispinModel(shape=shape, temperature=2.0)
+
+    model.update()
+
+    assert model.bits.shape == shape
+    assert model.bits.dtype == np.uint64
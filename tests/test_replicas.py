@@ -0,0 +1,44 @@
+"""Test the replicas module."""
+
+import numpy as np
+
+
+def test_replica_model():
+    """Test the ReplicaModel class."""
+    from IsingModel.replicas import ReplicaModel
+
+    shape = (10, 5)
+    model = ReplicaModel(shape=shape, temperatures=[1.0, 2.0, 3.0])
+
+    assert model.replicas == 3
+    assert model.lattice.shape == (3, 10, 5)
+    assert model.lattice.dtype == np.int8
+
+
+def test_replica_observables():
+    """Test per-replica magnetism and energy."""
+    from IsingModel.replicas import ReplicaModel
+
+    shape = (5, 5)
+    model = ReplicaModel(shape=shape, temperatures=[1.0, 2.0], energy_j=2)
+
+    model.lattice = np.ones((2, 5, 5), dtype=np.int8)
+    assert np.all(model.magnetism == 25)
+    assert np.all(model.energy == -100)
+
+    model.lattice[1] *= -1
+    assert np.all(model.magnetism == 25)
+    assert np.all(model.energy == -100)
+
+
+def test_replica_update():
+    """Test a batched sweep keeps every replica well formed."""
+    from IsingModel.replicas import ReplicaModel
+
+    model = ReplicaModel(shape=(4, 4), temperatures=[0.01, 5.0])
+
+    model.lattice = np.ones((2, 4, 4), dtype=np.int8)
+    model.update()
+
+    assert np.all(np.abs(model.lattice) == 1)
+    assert np.all(model.lattice[0] == 1)